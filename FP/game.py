@@ -1,8 +1,13 @@
 import tkinter as tk
+import array
+import bisect
 import time
 import math
+import random
 import json
 import os
+import pickle
+import threading
 
 # =========================
 # Config
@@ -16,16 +21,21 @@ ACCEL = 620.0
 BRAKE = 980.0
 ROLL_DECEL = 720.0
 FRAME_DT = 1/60
+HUD_EVERY = 4  # frames between HUD text refreshes (15 Hz at 60 fps)
 TRACK_LENGTH = 3600.0
+GROUND_STEP = 8  # screen px between ground polygon samples
 
 BOT_COUNT_DEFAULT = 3
+MAX_BOTS = 5
 COUNTDOWN_MS = 3000
 
 OBST_ROCKS = 12
 OBST_LOGS = 8
 OBST_RAMPS = 8
+OB_ROCK, OB_LOG, OB_RAMP = 0, 1, 2  # obstacle type codes
 
-STATS_FILE = "dirt_dash_stats.json"
+STATS_FILE = "dirt_dash_stats.pkl"
+LEGACY_STATS_FILE = "dirt_dash_stats.json"  # read if no pickle has been written yet
 
 # =========================
 # Persisted stats
@@ -33,18 +43,39 @@ STATS_FILE = "dirt_dash_stats.json"
 def load_stats():
     try:
         if os.path.exists(STATS_FILE):
-            with open(STATS_FILE, "r", encoding="utf-8") as f:
+            with open(STATS_FILE, "rb") as f:
+                return pickle.load(f)
+        if os.path.exists(LEGACY_STATS_FILE):
+            with open(LEGACY_STATS_FILE, "r", encoding="utf-8") as f:
                 return json.load(f)
     except Exception:
         pass
     return {"total_races": 0, "wins": 0, "best_time": None, "reduced_motion": True, "bots": BOT_COUNT_DEFAULT}
 
+_save_lock = threading.Lock()
+_save_seq = 0  # last snapshot handed to a writer
+_saved_seq = 0  # last snapshot written to disk
+
+def _write_stats(snapshot, seq):
+    global _saved_seq
+    with _save_lock:
+        if seq < _saved_seq:
+            return  # a newer snapshot already landed
+        _saved_seq = seq
+        try:
+            # write then swap, so a save cut short at exit can't corrupt the file
+            tmp = STATS_FILE + ".tmp"
+            with open(tmp, "wb") as f:
+                pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, STATS_FILE)
+        except Exception:
+            pass
+
 def save_stats(stats):
-    try:
-        with open(STATS_FILE, "w", encoding="utf-8") as f:
-            json.dump(stats, f)
-    except Exception:
-        pass
+    # Write off the Tk thread; the copy keeps later edits out of the snapshot
+    global _save_seq
+    _save_seq += 1
+    threading.Thread(target=_write_stats, args=(dict(stats), _save_seq), daemon=True).start()
 
 stats = load_stats()
 
@@ -61,24 +92,32 @@ def fmt_time(t):
     s = t - 60 * m
     return f"{m}:{s:05.2f}"
 
-def seeded_rand(seed):
-    # Simple LCG, returns function that yields [0,1)
-    state = {"x": seed & 0x7fffffff}
-    def rnd():
-        state["x"] = (1103515245 * state["x"] + 12345) & 0x7fffffff
-        return state["x"] / 0x7fffffff
-    return rnd
+_sin = math.sin
 
-def ground_y_at(xw):
+def ground_profile(xw):
     # Gentle slopes for comfort
     return (GROUND_BASE_Y
-            + 16.0 * math.sin((xw + 200) / 260.0)
-            + 12.0 * math.sin((xw + 900) / 180.0))
+            + 16.0 * _sin((xw + 200) / 260.0)
+            + 12.0 * _sin((xw + 900) / 180.0))
+
+# Ground height sampled once per world unit; covers the camera's full view at the finish line
+_GROUND_LUT = array.array("f", [ground_profile(x) for x in range(int(TRACK_LENGTH) + W + 16)])
+_GROUND_LUT_LEN = len(_GROUND_LUT)
+
+def ground_y_at(xw):
+    i = int(xw)
+    if 0 <= i < _GROUND_LUT_LEN:
+        return _GROUND_LUT[i]
+    # the player and camera carry on past the finish while bots are still racing
+    return ground_profile(xw)
 
 # =========================
 # Entities
 # =========================
 class Bike:
+    __slots__ = ("is_bot", "name", "color", "xw", "y", "vy", "speed", "engine_on",
+                 "finished", "finish_time", "bump_cooldown")
+
     def __init__(self, color="#FFD166", is_bot=False, name="You"):
         self.is_bot = is_bot
         self.name = name
@@ -95,49 +134,19 @@ class Bike:
     def on_ground(self):
         return abs(self.y - (ground_y_at(self.xw) - 36)) < 0.2
 
-    def update_physics(self, dt):
-        self.vy += GRAVITY * dt
-        self.y += self.vy * dt
-        floor = ground_y_at(self.xw) - 36
-        if self.y >= floor:
-            self.y = floor
-            self.vy = 0.0
-        if self.bump_cooldown > 0:
-            self.bump_cooldown -= dt
-
     def jump(self, vy=JUMP_VY):
         if self.on_ground():
             self.vy = vy
 
 class BotAI:
+    __slots__ = ("bike", "target_speed", "jump_bias", "name", "next_ob")
+
     def __init__(self, bike, target=220.0, jump_bias=0.0, name="Bot"):
         self.bike = bike
         self.target_speed = target
         self.jump_bias = jump_bias
         self.name = name
-
-    def step(self, dt, obstacles):
-        b = self.bike
-        if b.finished:
-            return
-        # Maintain target speed
-        if b.speed < self.target_speed:
-            b.speed = min(b.speed + (ACCEL * 0.8) * dt, self.target_speed)
-        else:
-            b.speed = max(b.speed - (ROLL_DECEL * 0.4) * dt, self.target_speed * 0.9)
-        # Look ahead and jump if needed
-        look = 140 + self.jump_bias
-        for ob in obstacles:
-            dx = ob["xw"] - b.xw
-            if 0 < dx < look:
-                if b.on_ground():
-                    if ob["type"] == "ramp":
-                        b.jump(JUMP_VY * 0.95)
-                    else:
-                        b.jump(JUMP_VY * 0.88)
-                break
-        b.xw += b.speed * dt
-        b.update_physics(dt)
+        self.next_ob = 0  # index of the first obstacle ahead of the bike
 
 # =========================
 # Game
@@ -154,13 +163,29 @@ class Game:
         self.player = Bike()
         self.bots = []
         self.bot_ai = []
+        self.entities = [self.player]  # player first, then bots; rebuilt by build_bots
+        self._all_entities = [(self.player, None)]  # (bike, ai) pairs; ai is None for the player
         self.time_elapsed = 0.0
         self.countdown_end = None
         self.results = []
         self.bot_count = int(stats.get("bots", BOT_COUNT_DEFAULT))
         self.reduced_motion = bool(stats.get("reduced_motion", True))
+        # parallax factor and camera ease, picked once per reduced_motion change
+        self._par_factor = 0.15 if self.reduced_motion else 0.3
+        self._cam_lerp = 0.12 if self.reduced_motion else 0.2
+        self._off1 = self._off2 = 0.0  # parallax band offsets, see _update_parallax()
         self.last_time = time.perf_counter()
         self.home_buttons = []  # list of (x0,y0,x1,y1, callback, label)
+        self.ids = {}  # persistent canvas items, see build_scene()
+        self.placed = {}  # item (or bike item tuple) -> geometry it was last placed with
+        self.shown_text = {}  # text item -> string it currently shows
+        # HUD values the time/speed strings were last formatted for
+        self._last_time_key = -1
+        self._last_speed_key = -1
+        self.overlay = None  # state whose overlay is currently on the canvas
+        self._ground_sx = list(range(0, W + GROUND_STEP, GROUND_STEP))
+        self.build_scene()
+        self.clear_obstacles()
         self.bind_events()
         self.start_loop()
         self.draw_home()
@@ -213,6 +238,8 @@ class Game:
     # -------------
     def start_loop(self):
         self.last_time = time.perf_counter()
+        self.next_frame = self.last_time + FRAME_DT  # wallclock target of the next frame
+        self.frame_no = 0
         self.root.after(int(1000 * FRAME_DT), self.loop)
 
     def loop(self):
@@ -227,8 +254,19 @@ class Game:
             # countdown display only
             pass
 
-        self.draw()
-        self.root.after(int(1000 * FRAME_DT), self.loop)
+        # entities every frame, HUD text at a lower rate
+        self.frame_no += 1
+        self.draw_core()
+        if self.frame_no % HUD_EVERY == 0:
+            self.draw_hud()
+
+        # schedule against a fixed timeline so after() jitter doesn't accumulate
+        self.next_frame += FRAME_DT
+        now = time.perf_counter()
+        if self.next_frame <= now:
+            # stalled: skip the missed frames (dt is capped above) instead of bursting
+            self.next_frame = now + FRAME_DT
+        self.root.after(max(1, int((self.next_frame - now) * 1000)), self.loop)
 
     # -------------
     # Flow control
@@ -244,6 +282,7 @@ class Game:
         stats["reduced_motion"] = self.reduced_motion
         save_stats(stats)
         self.state = "HOME"
+        self.clear_obstacles()
         self.draw_home()
 
     def start_race(self):
@@ -253,6 +292,7 @@ class Game:
         self.world_x = 0.0
         self.player = Bike()
         self.player.engine_on = False
+        self._update_parallax()
         self.spawn_obstacles()
         self.build_bots()
         self.countdown_end = time.perf_counter() + (COUNTDOWN_MS/1000.0)
@@ -266,100 +306,207 @@ class Game:
             self.bots.append(b)
             ai = BotAI(b, target=220.0 + 12*i, jump_bias=10*i, name=b.name)
             self.bot_ai.append(ai)
+        self.entities = [self.player, *self.bots]
+        self._all_entities = [(self.player, None)] + list(zip(self.bots, self.bot_ai))
+        # show one pooled set of canvas items per bot
+        for i, items in enumerate(self.bot_items):
+            if i < len(self.bots):
+                self.canvas.itemconfig(items[0], fill=self.bots[i].color)
+                self.canvas.itemconfig(f"bot{i}", state="normal")
+            else:
+                self.canvas.itemconfig(f"bot{i}", state="hidden")
 
     # -------------
     # Track and obstacles
     # -------------
     def spawn_obstacles(self):
-        self.obstacles = []
-        rnd = seeded_rand(1337)
+        obs = []  # (xw, type, w, h, r)
+        # fixed seed keeps the course the same every race; jitter for each type drawn in one call
+        rng = random.Random(1337)
+        rocks_off = rng.choices(range(-26, 27), k=OBST_ROCKS)
+        logs_off = rng.choices(range(-36, 37), k=OBST_LOGS)
+        ramps_off = rng.choices(range(-30, 31), k=OBST_RAMPS)
         # rocks
         for n in range(OBST_ROCKS):
-            xw = 240 + (TRACK_LENGTH - 480) * (n + 1) / (OBST_ROCKS + 1) + int(rnd()*53) - 26
+            xw = 240 + (TRACK_LENGTH - 480) * (n + 1) / (OBST_ROCKS + 1) + rocks_off[n]
             r = 10 + (n * 31) % 7
-            self.obstacles.append({"type": "rock", "xw": xw, "r": r})
+            obs.append((xw, OB_ROCK, 0, 0, r))
         # logs
         for n in range(OBST_LOGS):
-            xw = 400 + (TRACK_LENGTH - 800) * (n + 1) / (OBST_LOGS + 1) + int(rnd()*73) - 36
+            xw = 400 + (TRACK_LENGTH - 800) * (n + 1) / (OBST_LOGS + 1) + logs_off[n]
             w = 56 + (n * 13) % 16
             h = 12
-            self.obstacles.append({"type": "log", "xw": xw, "w": w, "h": h})
+            obs.append((xw, OB_LOG, w, h, 0))
         # ramps
         for n in range(OBST_RAMPS):
-            xw = 350 + (TRACK_LENGTH - 700) * (n + 1) / (OBST_RAMPS + 1) + int(rnd()*61) - 30
+            xw = 350 + (TRACK_LENGTH - 700) * (n + 1) / (OBST_RAMPS + 1) + ramps_off[n]
             w = 84
             h = 40
-            self.obstacles.append({"type": "ramp", "xw": xw, "w": w, "h": h})
-        self.obstacles.sort(key=lambda o: o["xw"])
+            obs.append((xw, OB_RAMP, w, h, 0))
+        obs.sort(key=lambda o: o[0])
+        # one column per field, sorted by xw so lookups can bisect obs_xw
+        self.obs_xw = array.array("d", [o[0] for o in obs])
+        self.obs_type = array.array("b", [o[1] for o in obs])
+        self.obs_w = array.array("d", [o[2] for o in obs])
+        self.obs_h = array.array("d", [o[3] for o in obs])
+        self.obs_r = array.array("d", [o[4] for o in obs])
+        # obstacles never move, so their ground height is looked up once here
+        self.obs_gy = array.array("d", [ground_y_at(x) for x in self.obs_xw])
+
+        # repurpose pooled canvas items; draw_obstacles shows the ones in view
+        self.canvas.itemconfig("obstacle", state="hidden")
+        free = {t: iter(items) for t, items in self.obs_pool.items()}
+        self.obs_item = [next(free[t]) for t in self.obs_type]
+        self.obs_view = (0, 0)
+
+    def clear_obstacles(self):
+        # empty track: no obstacle columns, every pooled item hidden
+        self.obs_xw = array.array("d")
+        self.obs_type = array.array("b")
+        self.obs_w = array.array("d")
+        self.obs_h = array.array("d")
+        self.obs_r = array.array("d")
+        self.obs_gy = array.array("d")
+        self.obs_item = []
+        self.obs_view = (0, 0)  # index range of obstacles currently shown
+        self.canvas.itemconfig("obstacle", state="hidden")
 
     # -------------
     # Update
     # -------------
     def update_play(self, dt):
-        # Engine and input
-        if not self.player.engine_on:
-            self.player.speed = max(0.0, self.player.speed - ROLL_DECEL * dt)
-        else:
-            if "Right" in self.keys:
-                self.player.speed = clamp(self.player.speed + ACCEL * dt, 0, MAX_SPEED)
-            elif "Left" in self.keys:
-                self.player.speed = clamp(self.player.speed - BRAKE * dt, 0, MAX_SPEED)
+        # One pass per entity: throttle, look-ahead, integrate, obstacles, finish.
+        # Everything the loop reads is bound to locals once per frame.
+        keys = self.keys
+        _clamp = clamp
+        lut = _GROUND_LUT
+        nlut = _GROUND_LUT_LEN
+        obs_xw = self.obs_xw
+        obs_type = self.obs_type
+        n = len(obs_xw)
+        gdt = GRAVITY * dt
+        up = (ACCEL * 0.8) * dt
+        down = (ROLL_DECEL * 0.4) * dt
+        all_done = True
+        for b, ai in self._all_entities:
+            xw = b.xw
+            y = b.y
+            vy = b.vy
+            speed = b.speed
+            if ai is None:
+                # Engine and input
+                if not b.engine_on:
+                    speed = max(0.0, speed - ROLL_DECEL * dt)
+                elif "Right" in keys:
+                    speed = _clamp(speed + ACCEL * dt, 0, MAX_SPEED)
+                elif "Left" in keys:
+                    speed = _clamp(speed - BRAKE * dt, 0, MAX_SPEED)
+                else:
+                    speed = _clamp(speed - ROLL_DECEL * dt, 0, MAX_SPEED)
             else:
-                self.player.speed = clamp(self.player.speed - ROLL_DECEL * dt, 0, MAX_SPEED)
-
-        # Advance world
-        self.player.xw += self.player.speed * dt
-        self.player.update_physics(dt)
-
-        # Bots
-        for ai in self.bot_ai:
-            ai.step(dt, self.obstacles)
-
-        # Obstacle interaction (player)
-        self.handle_obstacles(self.player)
-
-        # Finish check
-        everyone = [self.player] + self.bots
-        for b in everyone:
-            if (not b.finished) and b.xw >= TRACK_LENGTH:
+                # bots park once they cross the line
+                if b.finished:
+                    continue
+                # Maintain target speed
+                target = ai.target_speed
+                if speed < target:
+                    speed = min(speed + up, target)
+                else:
+                    speed = max(speed - down, target * 0.9)
+                # Look ahead and jump if needed; bikes only move forward, so the
+                # cursor just walks past cleared obstacles
+                k = ai.next_ob
+                while k < n and obs_xw[k] <= xw:
+                    k += 1
+                ai.next_ob = k
+                if k < n and obs_xw[k] - xw < 140 + ai.jump_bias:
+                    i = int(xw)
+                    gy = lut[i] if 0 <= i < nlut else ground_profile(xw)
+                    if -0.2 < y - (gy - 36) < 0.2:
+                        vy = JUMP_VY * 0.95 if obs_type[k] == OB_RAMP else JUMP_VY * 0.88
+
+            # Advance world: gravity, floor and bump cooldown
+            xw += speed * dt
+            vy += gdt
+            y += vy * dt
+            i = int(xw)
+            floor = (lut[i] if 0 <= i < nlut else ground_profile(xw)) - 36
+            if y >= floor:
+                y = floor
+                vy = 0.0
+            if b.bump_cooldown > 0:
+                b.bump_cooldown -= dt
+            b.xw = xw
+            b.y = y
+            b.vy = vy
+            b.speed = speed
+
+            # Obstacle interaction (player only)
+            if ai is None:
+                self.handle_obstacles(b)
+
+            # Finish check
+            if (not b.finished) and xw >= TRACK_LENGTH:
                 b.finished = True
                 b.finish_time = self.time_elapsed
+            all_done = all_done and b.finished
 
         # Race finished?
-        if all(b.finished or b.xw >= TRACK_LENGTH for b in everyone):
+        if all_done:
             self.end_race()
 
         # Timer
         self.time_elapsed += dt
 
+        self._update_camera()
+
+    def _update_camera(self):
+        # ease world_x toward player x to reduce motion (smoother camera)
+        self.world_x += (self.player.xw - self.world_x) * self._cam_lerp
+        self._update_parallax()
+
+    def _update_parallax(self):
+        # parallax bands follow whatever world_x currently is
+        wx = self.world_x
+        p = self._par_factor
+        self._off1 = -((wx * p) % W)
+        self._off2 = -((wx * p * 1.4) % W)
+
     def handle_obstacles(self, bike):
-        # simple collisions/jumps
-        for ob in self.obstacles:
-            dx = ob["xw"] - bike.xw
-            if -30 <= dx <= 30:
-                gy = ground_y_at(ob["xw"])
-                if ob["type"] == "rock":
-                    top = gy - ob["r"]
-                    if bike.y >= top - 10 and bike.bump_cooldown <= 0:
-                        bike.speed = max(bike.speed * 0.6, bike.speed - 80)
-                        bike.vy = -120
-                        bike.bump_cooldown = 0.6
-                elif ob["type"] == "log":
-                    top = gy - ob["h"]
-                    if bike.y >= top - 10 and bike.bump_cooldown <= 0:
-                        bike.speed = max(bike.speed * 0.7, bike.speed - 90)
-                        bike.vy = -150
-                        bike.bump_cooldown = 0.6
-                else:  # ramp, give a lift if on ground and at ramp mouth
-                    mouth_left = ob["xw"] - ob["w"] / 2
-                    mouth_right = ob["xw"] + ob["w"] / 2
-                    if mouth_left - 10 <= bike.xw <= mouth_right + 10 and bike.on_ground():
-                        bike.vy = JUMP_VY * 0.9  # gentle ramp jump
+        # simple collisions/jumps, only against obstacles within 30 of the bike
+        xs = self.obs_xw
+        obs_type = self.obs_type
+        obs_gy = self.obs_gy
+        bxw = bike.xw
+        i = bisect.bisect_left(xs, bxw - 30)
+        j = bisect.bisect_right(xs, bxw + 30, i)
+        for k in range(i, j):
+            gy = obs_gy[k]
+            t = obs_type[k]
+            if t == OB_ROCK:
+                top = gy - self.obs_r[k]
+                if bike.y >= top - 10 and bike.bump_cooldown <= 0:
+                    bike.speed = max(bike.speed * 0.6, bike.speed - 80)
+                    bike.vy = -120
+                    bike.bump_cooldown = 0.6
+            elif t == OB_LOG:
+                top = gy - self.obs_h[k]
+                if bike.y >= top - 10 and bike.bump_cooldown <= 0:
+                    bike.speed = max(bike.speed * 0.7, bike.speed - 90)
+                    bike.vy = -150
+                    bike.bump_cooldown = 0.6
+            else:  # ramp, give a lift if on ground and at ramp mouth
+                oxw = xs[k]
+                mouth_left = oxw - self.obs_w[k] / 2
+                mouth_right = oxw + self.obs_w[k] / 2
+                # on_ground, inlined
+                if mouth_left - 10 <= bxw <= mouth_right + 10 and -0.2 < bike.y - (ground_y_at(bxw) - 36) < 0.2:
+                    bike.vy = JUMP_VY * 0.9  # gentle ramp jump
 
     def end_race(self):
         # gather results (sort by finish_time)
         everyone = []
-        for b in [self.player] + self.bots:
+        for b in self.entities:
             t = b.finish_time if b.finish_time is not None else self.time_elapsed
             everyone.append((b.name, t))
         everyone.sort(key=lambda t: t[1])
@@ -382,11 +529,115 @@ class Game:
 
         self.state = "END"
 
+    # -------------
+    # Scene
+    # -------------
+    def build_scene(self):
+        # Persistent canvas items; the draw methods only move and restyle them
+        cv = self.canvas
+        ids = self.ids
+        # parallax bands (sky is canvas background)
+        ids["band1"] = cv.create_rectangle(0, H - 260, W * 2, H, fill="#1B2438", width=0)
+        ids["band2"] = cv.create_rectangle(0, H - 200, W * 2, H, fill="#162034", width=0)
+        # stands strip
+        cv.create_rectangle(0, H - 150, W, H - 90, fill="#121A2A", width=0)
+        ids["ground"] = cv.create_polygon(0, H, W, H, 0, H, fill="#2C3A4F", outline="#192235")
+
+        # finish, laid out at its world x while world_x is 0
+        fx = TRACK_LENGTH
+        cv.create_rectangle(fx, H - 320, fx + 6, H, fill="#0EA5E9", width=0, tags="finish")
+        # checker
+        for r in range(3):
+            for c in range(3):
+                if (r + c) % 2 == 0:
+                    x0 = fx + 6 + c * 8
+                    y0 = H - 320 + r * 8
+                    cv.create_rectangle(x0, y0, x0 + 8, y0 + 8, fill="#111827", width=0, tags="finish")
+        # start
+        cv.create_rectangle(0, H - 320, 6, H, fill="#10B981", width=0, tags="start")
+        cv.create_rectangle(6, H - 320, 6 + 70, H - 298, fill="#22D3EE", width=0, tags="start")
+        self.marker_x = 0.0  # world_x the markers are currently laid out for
+
+        # obstacle pools, one item per obstacle of each type; spawn_obstacles hands them out
+        self.obs_pool = {
+            OB_ROCK: [cv.create_oval(0, 0, 0, 0, fill="#7DD3FC", outline="#0EA5E9", width=2,
+                                     state="hidden", tags="obstacle") for _ in range(OBST_ROCKS)],
+            OB_LOG: [cv.create_rectangle(0, 0, 0, 0, fill="#A78B6A", outline="#6B4F33", width=2,
+                                         state="hidden", tags="obstacle") for _ in range(OBST_LOGS)],
+            OB_RAMP: [cv.create_polygon(0, 0, 0, 0, 0, 0, fill="#9CA3AF", outline="#6B7280", width=2,
+                                        state="hidden", tags="obstacle") for _ in range(OBST_RAMPS)],
+        }
+
+        # entities
+        ids["player"] = self.create_bike_items("player", self.player.color, "#2B2D42", "#F8FAFC", 3, "#E11D48")
+        self.bot_items = [self.create_bike_items(f"bot{i}", "#FFFFFF", "#0F172A", "#E5E7EB", 2, "#334155",
+                                                 state="hidden")
+                          for i in range(MAX_BOTS)]
+
+        # HUD
+        cv.create_rectangle(12, 12, 12 + 460, 12 + 92, fill="#00000059", outline="", width=0)
+        ids["time"] = cv.create_text(24, 36, anchor="w", fill="#E5E7EB", font=("Segoe UI", 14), text="")
+        ids["speed"] = cv.create_text(24, 60, anchor="w", fill="#E5E7EB", font=("Segoe UI", 12), text="")
+        ids["pos"] = cv.create_text(160, 60, anchor="w", fill="#E5E7EB", font=("Segoe UI", 12), text="")
+        # hint
+        cv.create_text(320, 60, anchor="w", fill="#CBD5E1", font=("Segoe UI", 10),
+                       text="S engine | → throttle | ← brake")
+        # status strip
+        ids["status"] = cv.create_text(12, H - 12, anchor="sw", fill="#CBD5E1", font=("Segoe UI", 10), text="")
+
+    def create_bike_items(self, tag, body, outline, wheel, wheel_width, head, state="normal"):
+        # body, rear wheel, front wheel, rider head
+        cv = self.canvas
+        return (cv.create_rectangle(0, 0, 0, 0, fill=body, outline=outline, width=2, tags=tag, state=state),
+                cv.create_oval(0, 0, 0, 0, outline=wheel, width=wheel_width, tags=tag, state=state),
+                cv.create_oval(0, 0, 0, 0, outline=wheel, width=wheel_width, tags=tag, state=state),
+                cv.create_oval(0, 0, 0, 0, fill=head, width=0, tags=tag, state=state))
+
+    def set_coords(self, item, *xy):
+        # Only talk to Tcl when the geometry changed; a still item costs a tuple
+        # compare instead of a round trip plus a canvas redraw. Anything moving
+        # on float coordinates misses every frame, so this pays off in still
+        # scenes (settled camera, paused/results screens, parked bots).
+        if self.placed.get(item) != xy:
+            self.placed[item] = xy
+            self.canvas.coords(item, *xy)
+
+    def set_text(self, item, text):
+        # same idea as set_coords() for text items
+        if self.shown_text.get(item) != text:
+            self.shown_text[item] = text
+            self.canvas.itemconfig(item, text=text)
+
+    def place_bike(self, items, sx, sy):
+        # all four items move together, so one key covers the whole bike;
+        # only a bike that is standing still hits it
+        key = (sx, sy)
+        if self.placed.get(items) == key:
+            return
+        self.placed[items] = key
+        coords = self.canvas.coords
+        body, rear, front, head = items
+        coords(body, sx - 30, sy - 12, sx + 32, sy + 6)
+        coords(rear, sx - 30 - 12, sy + 6, sx - 30 + 12, sy + 30)
+        coords(front, sx + 20 - 12, sy + 6, sx + 20 + 12, sy + 30)
+        coords(head, sx - 2 - 6, sy - 12 - 6, sx - 2 + 6, sy - 12 + 6)
+
+    def overlay_changed(self):
+        # Overlays are static per state, so they are only rebuilt when it changes
+        if self.overlay == self.state:
+            return False
+        self.canvas.delete("overlay")
+        self.overlay = self.state
+        return True
+
     # -------------
     # Draw
     # -------------
     def draw(self):
-        self.canvas.delete("all")
+        self.draw_core()
+        self.draw_hud()
+
+    def draw_core(self):
         # Background
         self.draw_background()
         # Ground and level
@@ -398,154 +649,147 @@ class Game:
         self.draw_player()
         self.draw_bots()
 
-        # HUD and overlays
-        self.draw_hud()
-
-        if self.state == "HOME":
-            self.draw_home_overlay()
-        elif self.state == "GRID":
+        # Overlays; the countdown also starts the race, so it runs every frame
+        if self.state == "GRID":
             self.draw_grid_overlay()
-        elif self.state == "PAUSE":
-            self.draw_pause_overlay()
-        elif self.state == "END":
-            self.draw_end_overlay()
+        if self.overlay_changed():
+            if self.state == "HOME":
+                self.draw_home_overlay()
+            elif self.state == "PAUSE":
+                self.draw_pause_overlay()
+            elif self.state == "END":
+                self.draw_end_overlay()
 
     def draw_background(self):
-        # sky is canvas background
-        # parallax bands
-        par = 0.15 if self.reduced_motion else 0.3
-        off1 = -((self.world_x * par) % W)
-        off2 = -((self.world_x * par * 1.4) % W)
+        # parallax bands, offsets come from _update_parallax()
+        off1 = self._off1
+        off2 = self._off2
         y1 = H - 260
         y2 = H - 200
-        self.canvas.create_rectangle(off1, y1, off1 + W * 2, H, fill="#1B2438", width=0)
-        self.canvas.create_rectangle(off2, y2, off2 + W * 2, H, fill="#162034", width=0)
-        # stands strip
-        self.canvas.create_rectangle(0, H - 150, W, H - 90, fill="#121A2A", width=0)
+        self.set_coords(self.ids["band1"], off1, y1, off1 + W * 2, H)
+        self.set_coords(self.ids["band2"], off2, y2, off2 + W * 2, H)
 
     def draw_ground(self):
-        # camera scroll
-        target_x = self.player.xw
-        # ease world_x toward player x to reduce motion (smoother camera)
-        self.world_x += (target_x - self.world_x) * (0.12 if self.reduced_motion else 0.2)
-
-        step = 8
-        pts = []
-        for sx in range(0, W + step, step):
-            xw = self.world_x + sx
-            y = ground_y_at(xw)
-            pts.append((sx, y))
-        # close polygon to bottom
-        poly = []
-        for (x, y) in pts:
-            poly.extend([x, y])
+        # the polygon only depends on the whole-unit camera position
+        ground = self.ids["ground"]
+        base = int(self.world_x)
+        if self.placed.get(ground) == base:
+            return
+        self.placed[ground] = base
+        sxs = self._ground_sx
+        n = len(sxs)
+        if 0 <= base and base + W + GROUND_STEP <= _GROUND_LUT_LEN:
+            # strided slice of the table gives every sample in one C-level copy
+            ys = _GROUND_LUT[base:base + W + GROUND_STEP:GROUND_STEP].tolist()
+        else:
+            gya = ground_y_at
+            ys = [gya(base + sx) for sx in sxs]
+        # interleave x/y and close polygon to bottom
+        poly = [0.0] * (2 * n)
+        poly[0::2] = sxs
+        poly[1::2] = ys
         poly.extend([W, H, 0, H])
-        self.canvas.create_polygon(*poly, fill="#2C3A4F", outline="#192235")
+        self.canvas.coords(ground, *poly)
 
     def draw_finish_start(self):
-        # finish
-        fx = TRACK_LENGTH - self.world_x
-        if -50 <= fx <= W + 50:
-            self.canvas.create_rectangle(fx, H - 320, fx + 6, H, fill="#0EA5E9", width=0)
-            # checker
-            for r in range(3):
-                for c in range(3):
-                    if (r + c) % 2 == 0:
-                        x0 = fx + 6 + c * 8
-                        y0 = H - 320 + r * 8
-                        self.canvas.create_rectangle(x0, y0, x0 + 8, y0 + 8, fill="#111827", width=0)
-        # start
-        sx = 0 - self.world_x
-        if -50 <= sx <= W + 50:
-            self.canvas.create_rectangle(sx, H - 320, sx + 6, H, fill="#10B981", width=0)
-            self.canvas.create_rectangle(sx + 6, H - 320, sx + 6 + 70, H - 298, fill="#22D3EE", width=0)
+        # both markers are laid out relative to world_x == marker_x; shift them to the camera
+        dx = self.marker_x - self.world_x
+        if dx:
+            move = self.canvas.move
+            move("finish", dx, 0)
+            move("start", dx, 0)
+            self.marker_x = self.world_x
 
     def draw_obstacles(self):
-        for ob in self.obstacles:
-            x = ob["xw"] - self.world_x
-            y = ground_y_at(ob["xw"])
-            if -100 <= x <= W + 100:
-                if ob["type"] == "rock":
-                    r = ob["r"]
-                    self.canvas.create_oval(x - r, y - 2 * r, x + r, y, fill="#7DD3FC", outline="#0EA5E9", width=2)
-                elif ob["type"] == "log":
-                    w = ob["w"]; h = ob["h"]
-                    self.canvas.create_rectangle(x - w/2, y - h, x + w/2, y, fill="#A78B6A", outline="#6B4F33", width=2)
-                else:
-                    w = ob["w"]; h = ob["h"]
-                    # ramp triangle
-                    self.canvas.create_polygon(x - w/2, y, x + w/2, y, x - w/2, y - h,
-                                               fill="#9CA3AF", outline="#6B7280", width=2)
+        coords = self.set_coords
+        itemconfig = self.canvas.itemconfig
+        wx = self.world_x
+        xs = self.obs_xw
+        items = self.obs_item
+        i = bisect.bisect_left(xs, wx - 100)
+        j = bisect.bisect_right(xs, wx + W + 100, i)
+        pi, pj = self.obs_view
+        # off-screen items are hidden rather than destroyed
+        for k in range(pi, pj):
+            if k < i or k >= j:
+                itemconfig(items[k], state="hidden")
+        # column slices of the visible window, screen x for all of them up front
+        sxs = [oxw - wx for oxw in xs[i:j]]
+        for k, x, y, t, w, h, r in zip(range(i, j), sxs, self.obs_gy[i:j], self.obs_type[i:j],
+                                       self.obs_w[i:j], self.obs_h[i:j], self.obs_r[i:j]):
+            if t == OB_ROCK:
+                coords(items[k], x - r, y - 2 * r, x + r, y)
+            elif t == OB_LOG:
+                coords(items[k], x - w/2, y - h, x + w/2, y)
+            else:
+                # ramp triangle
+                coords(items[k], x - w/2, y, x + w/2, y, x - w/2, y - h)
+            if k < pi or k >= pj:
+                itemconfig(items[k], state="normal")
+        self.obs_view = (i, j)
 
     def draw_player(self):
         # player drawn as bike rectangle + wheels
-        sx = (self.player.xw - self.world_x) + 220
-        sy = self.player.y
-        # body
-        self.canvas.create_rectangle(sx - 30, sy - 12, sx + 32, sy + 6, fill=self.player.color, outline="#2B2D42", width=2)
-        # wheels
-        self.canvas.create_oval(sx - 30 - 12, sy + 6, sx - 30 + 12, sy + 30, outline="#F8FAFC", width=3)
-        self.canvas.create_oval(sx + 20 - 12, sy + 6, sx + 20 + 12, sy + 30, outline="#F8FAFC", width=3)
-        # rider head
-        self.canvas.create_oval(sx - 2 - 6, sy - 12 - 6, sx - 2 + 6, sy - 12 + 6, fill="#E11D48", width=0)
+        self.place_bike(self.ids["player"], self.player.xw + (220 - self.world_x), self.player.y)
 
     def draw_bots(self):
-        for b in self.bots:
-            sx = (b.xw - self.world_x) + 220
-            sy = b.y
-            self.canvas.create_rectangle(sx - 30, sy - 12, sx + 32, sy + 6, fill=b.color, outline="#0F172A", width=2)
-            self.canvas.create_oval(sx - 42, sy + 6, sx - 18, sy + 30, outline="#E5E7EB", width=2)
-            self.canvas.create_oval(sx + 8, sy + 6, sx + 32, sy + 30, outline="#E5E7EB", width=2)
-            self.canvas.create_oval(sx - 2 - 6, sy - 12 - 6, sx - 2 + 6, sy - 12 + 6, fill="#334155", width=0)
+        off = 220 - self.world_x  # world x -> screen x, shared by every bot
+        place = self.place_bike
+        for b, items in zip(self.bots, self.bot_items):
+            place(items, b.xw + off, b.y)
 
     def draw_hud(self):
-        # bg
-        self.canvas.create_rectangle(12, 12, 12 + 460, 12 + 92, fill="#00000059", outline="", width=0)
-        # time
-        self.canvas.create_text(24, 36, anchor="w", fill="#E5E7EB", font=("Segoe UI", 14),
-                                text=f"Time {fmt_time(self.time_elapsed)}")
+        set_text = self.set_text
+        ids = self.ids
+        # time, only re-formatted when the shown hundredths change
+        k = int(self.time_elapsed * 100)
+        if k != self._last_time_key:
+            self._last_time_key = k
+            set_text(ids["time"], f"Time {fmt_time(self.time_elapsed)}")
         # speed
-        self.canvas.create_text(24, 60, anchor="w", fill="#E5E7EB", font=("Segoe UI", 12),
-                                text=f"Speed {int(self.player.speed)}")
-        # position
-        everyone = [("You", self.player.xw)] + [(b.name, b.xw) for b in self.bots]
-        everyone.sort(key=lambda t: -t[1])
-        pos = next((i+1 for i, (n, _) in enumerate(everyone) if n == "You"), 1)
-        self.canvas.create_text(160, 60, anchor="w", fill="#E5E7EB", font=("Segoe UI", 12),
-                                text=f"Pos {pos}/{len(everyone)}")
-        # hint
-        self.canvas.create_text(320, 60, anchor="w", fill="#CBD5E1", font=("Segoe UI", 10),
-                                text="S engine | → throttle | ← brake")
+        k = int(self.player.speed)
+        if k != self._last_speed_key:
+            self._last_speed_key = k
+            set_text(ids["speed"], f"Speed {k}")
+        # position: one plus every bot strictly ahead (ties go to the player)
+        pxw = self.player.xw
+        pos = 1 + sum(1 for b in self.bots if b.xw > pxw)
+        set_text(ids["pos"], f"Pos {pos}/{len(self.entities)}")
         # status strip
-        self.canvas.create_text(12, H - 12, anchor="sw", fill="#CBD5E1", font=("Segoe UI", 10),
-                                text=f"State: {self.state}   Engine: {'ON' if self.player.engine_on else 'OFF'}   Reduced motion: {'ON' if self.reduced_motion else 'OFF'}   Bots: {self.bot_count}")
+        set_text(ids["status"],
+                 f"State: {self.state}   Engine: {'ON' if self.player.engine_on else 'OFF'}   Reduced motion: {'ON' if self.reduced_motion else 'OFF'}   Bots: {self.bot_count}")
 
     # -------------
     # Overlays
     # -------------
     def draw_home(self):
-        self.canvas.delete("all")
-        self.draw_background()
-        self.draw_ground()
+        # Static showcase
+        self.world_x = 120.0
+        self._update_parallax()
+        self.overlay = None  # settings changed, rebuild the panel
+        self.draw()
+
+    def draw_home_overlay(self):
         self.home_buttons = []
         # panel
         x, y, w, h = 320, 140, 480, 300
-        self.canvas.create_rectangle(x, y, x + w, y + h, fill="#0000008C", outline="#0EA5E9", width=2)
+        self.canvas.create_rectangle(x, y, x + w, y + h, fill="#0000008C", outline="#0EA5E9", width=2, tags="overlay")
         self.canvas.create_text(x + 30, y + 40, anchor="w", fill="#F8FAFC", font=("Segoe UI", 22, "bold"),
-                                text="Race Setup")
+                                text="Race Setup", tags="overlay")
         best = fmt_time(stats.get("best_time"))
         races = stats.get("total_races", 0)
         wins = stats.get("wins", 0)
         self.canvas.create_text(x + 30, y + 70, anchor="w", fill="#CBD5E1", font=("Segoe UI", 12),
-                                text=f"Best: {best}   Races: {races}   Wins: {wins}")
+                                text=f"Best: {best}   Races: {races}   Wins: {wins}", tags="overlay")
 
         # Bots control
         self.canvas.create_text(x + 30, y + 100, anchor="w", fill="#E5E7EB", font=("Segoe UI", 12),
-                                text=f"Bots: {self.bot_count}")
+                                text=f"Bots: {self.bot_count}", tags="overlay")
         # buttons
         def button(rx, ry, rw, rh, label, cb):
-            self.canvas.create_rectangle(rx, ry, rx + rw, ry + rh, fill="#FFD166", outline="", width=0)
-            self.canvas.create_text(rx + rw/2, ry + rh/2, fill="#1F2937", font=("Segoe UI", 12, "bold"), text=label)
+            self.canvas.create_rectangle(rx, ry, rx + rw, ry + rh, fill="#FFD166", outline="", width=0, tags="overlay")
+            self.canvas.create_text(rx + rw/2, ry + rh/2, fill="#1F2937", font=("Segoe UI", 12, "bold"), text=label,
+                                    tags="overlay")
             self.home_buttons.append((rx, ry, rx + rw, ry + rh, cb, label))
 
         button(x + 140, y + 90, 28, 28, "-", self.dec_bots)
@@ -558,14 +802,6 @@ class Game:
         # Start
         button(x + 30, y + 180, 160, 38, "Start Race (Enter)", self.start_race)
 
-        # Static showcase
-        self.world_x = 120.0
-        self.draw()
-
-    def draw_home_overlay(self):
-        # Buttons already drawn in draw_home()
-        pass
-
     def draw_grid_overlay(self):
         # Countdown
         ms_left = int(max(0, (self.countdown_end - time.perf_counter()) * 1000))
@@ -576,35 +812,43 @@ class Game:
         if self.state == "GRID":
             sec = ms_left // 1000
             disp = "3" if sec >= 2 else "2" if sec >= 1 else "1" if ms_left > 0 else "GO"
-            self.canvas.create_text(W/2, H/2 - 60, fill="#FDE68A", font=("Segoe UI", 54, "bold"), text=disp)
+            if self.overlay_changed():
+                self.ids["countdown"] = self.canvas.create_text(W/2, H/2 - 60, fill="#FDE68A",
+                                                                font=("Segoe UI", 54, "bold"), text=disp,
+                                                                tags="overlay")
+            else:
+                self.canvas.itemconfig(self.ids["countdown"], text=disp)
 
     def draw_pause_overlay(self):
         # panel with resume button
         x, y, w, h = 400, 220, 300, 140
-        self.canvas.create_rectangle(x, y, x + w, y + h, fill="#0000008C", outline="#0EA5E9", width=2)
-        self.canvas.create_text(x + w/2, y + 40, fill="#F3F4F6", font=("Segoe UI", 20, "bold"), text="Paused")
+        self.canvas.create_rectangle(x, y, x + w, y + h, fill="#0000008C", outline="#0EA5E9", width=2, tags="overlay")
+        self.canvas.create_text(x + w/2, y + 40, fill="#F3F4F6", font=("Segoe UI", 20, "bold"), text="Paused",
+                                tags="overlay")
         # resume button
         rx, ry, rw, rh = x + 50, y + 70, 200, 34
-        self.canvas.create_rectangle(rx, ry, rx + rw, ry + rh, fill="#FFD166", outline="", width=0)
-        self.canvas.create_text(rx + rw/2, ry + rh/2, fill="#1F2937", font=("Segoe UI", 12, "bold"), text="Resume (P)")
+        self.canvas.create_rectangle(rx, ry, rx + rw, ry + rh, fill="#FFD166", outline="", width=0, tags="overlay")
+        self.canvas.create_text(rx + rw/2, ry + rh/2, fill="#1F2937", font=("Segoe UI", 12, "bold"), text="Resume (P)",
+                                tags="overlay")
         self.pause_btn_box = (rx, ry, rx + rw, ry + rh)
 
     def draw_end_overlay(self):
         x, y, w, h = 260, 120, 560, 320
-        self.canvas.create_rectangle(x, y, x + w, y + h, fill="#0000008C", outline="#0EA5E9", width=2)
+        self.canvas.create_rectangle(x, y, x + w, y + h, fill="#0000008C", outline="#0EA5E9", width=2, tags="overlay")
         self.canvas.create_text(x + 20, y + 40, anchor="w", fill="#F8FAFC", font=("Segoe UI", 22, "bold"),
-                                text="Race Results")
+                                text="Race Results", tags="overlay")
         yy = y + 70
         pos = 1
         for name, t in self.results:
             self.canvas.create_text(x + 20, yy, anchor="w", fill="#E5E7EB", font=("Segoe UI", 12),
-                                    text=f"{pos}. {name} — {fmt_time(t)}")
+                                    text=f"{pos}. {name} — {fmt_time(t)}", tags="overlay")
             yy += 24
             pos += 1
         # buttons
         def draw_btn(bx, by, bw, bh, label, cb):
-            self.canvas.create_rectangle(bx, by, bx + bw, by + bh, fill="#FFD166", outline="", width=0)
-            self.canvas.create_text(bx + bw/2, by + bh/2, fill="#1F2937", font=("Segoe UI", 12, "bold"), text=label)
+            self.canvas.create_rectangle(bx, by, bx + bw, by + bh, fill="#FFD166", outline="", width=0, tags="overlay")
+            self.canvas.create_text(bx + bw/2, by + bh/2, fill="#1F2937", font=("Segoe UI", 12, "bold"), text=label,
+                                    tags="overlay")
             self.home_buttons.append((bx, by, bx + bw, by + bh, cb, label))
         # reuse simple click system
         self.home_buttons = []
@@ -619,11 +863,13 @@ class Game:
         self.draw_home()
 
     def inc_bots(self):
-        self.bot_count = min(5, self.bot_count + 1)
+        self.bot_count = min(MAX_BOTS, self.bot_count + 1)
         self.draw_home()
 
     def toggle_rm(self):
         self.reduced_motion = not self.reduced_motion
+        self._par_factor = 0.15 if self.reduced_motion else 0.3
+        self._cam_lerp = 0.12 if self.reduced_motion else 0.2
         self.draw_home()
 
 